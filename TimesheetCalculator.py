@@ -4,6 +4,8 @@
 # based on their respective percentages defined in the config.py file. It also calculates
 # the number of full workdays and the remainder hours for each task.
 
+import sys
+
 import config
 
 def calculate_distribution(total_hours, distribution, workday_length):
@@ -28,9 +30,9 @@ def calculate_distribution(total_hours, distribution, workday_length):
     results = {}
     total_minutes = total_hours * 60
     for speedtype, percentage in distribution.items():
-        allocated_minutes = total_minutes * (percentage / 100)
-        hours = int(allocated_minutes // 60)
-        minutes = int(allocated_minutes % 60)
+        allocated_minutes = (total_minutes * percentage) // 100
+        hours = allocated_minutes // 60
+        minutes = allocated_minutes % 60
         
         # Calculate the number of full workdays and remainder
         full_workdays = hours // workday_length
@@ -48,10 +50,11 @@ def print_distribution(results, total_hours, workday_length):
         total_hours (int): The total number of hours to be distributed.
         workday_length (int): The length of a workday in hours.
     """
-    print(f"Total Hours: {total_hours}")
+    lines = [f"Total Hours: {total_hours}"]
     for speedtype, (hours, minutes, percentage, full_workdays, remainder_hours, remainder_minutes) in results.items():
-        print(f"{speedtype}: {hours} hours and {minutes} minutes ({percentage}%)")
-        print(f"    -> {full_workdays} full {workday_length}-hour workdays, {remainder_hours} hours and {remainder_minutes} minutes remainder")
+        lines.append(f"{speedtype}: {hours} hours and {minutes} minutes ({percentage}%)")
+        lines.append(f"    -> {full_workdays} full {workday_length}-hour workdays, {remainder_hours} hours and {remainder_minutes} minutes remainder")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """